@@ -5,82 +5,157 @@ Additional enhancements and utilities
 """
 
 import os
+import re
+import copy
 import json
 import time
+import atexit
+import sqlite3
+import hashlib
+import threading
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Buffered statistics are written to disk after this many records, and at exit
+_STATS_FLUSH_EVERY = 50
+
+_DEFAULT_STATS = {
+    "total_conversions": 0,
+    "successful_conversions": 0,
+    "failed_conversions": 0,
+    "total_pages_processed": 0,
+    "average_processing_time": 0,
+    "models_used": {},
+    "extraction_methods_used": {},
+    "last_conversion": None,
+    "last_conversion_ts": None
+}
+
+# Quality-check patterns, compiled once per process
+_MERGED_RE = [re.compile(p) for p in (
+    r'[a-z][A-Z]',  # camelCase
+    r'[a-zA-Z]\d',  # word+number
+    r'\d[a-zA-Z]',  # number+word
+    r'[.!?][A-Z]',  # punctuation+capital
+)]
+_EXCESS_SPACES_RE = re.compile(r' {3,}')
+_GARBLED_RES = [
+    re.compile(r'[^\w\s\.,!?;:()\-\'\"]{3,}'),  # 3+ special chars in a row
+    # Very long words (likely merged). A greedy \w{50,} can only ever match
+    # from the start of a word, so anchoring it with \b gives the same matches
+    # without re-attempting the match from every position inside each word.
+    re.compile(r'\b\w{50,}'),
+]
+
+_HEADING_PREFIXES = ('Chapter', 'Section', 'Part')
+
 class ConversionStats:
     """Track conversion statistics and performance"""
     
+    # Statistics are loaded once per process and shared by every instance
+    # using the same file, so buffered records held by one converter are
+    # never overwritten by a stale copy loaded by another. The lock lets
+    # conversions running in several threads record into them.
+    _shared_state = {}
+    
     def __init__(self):
         self.stats_file = "conversion_stats.json"
-        self.stats = self.load_stats()
+        state_key = os.path.abspath(self.stats_file)
+        state = ConversionStats._shared_state.get(state_key)
+        if state is None:
+            state = {"stats": self.load_stats(), "pending": 0, "lock": threading.RLock()}
+            ConversionStats._shared_state[state_key] = state
+            atexit.register(self.flush)
+        self._state = state
+        self.stats = state["stats"]
     
     def load_stats(self):
         """Load existing statistics"""
+        stats = None
         try:
-            if os.path.exists(self.stats_file):
-                with open(self.stats_file, 'r') as f:
-                    return json.load(f)
+            with open(self.stats_file, 'rb') as f:
+                data = f.read()
+            stats = orjson.loads(data) if orjson else json.loads(data)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to load stats: {e}")
         
-        return {
-            "total_conversions": 0,
-            "successful_conversions": 0,
-            "failed_conversions": 0,
-            "total_pages_processed": 0,
-            "average_processing_time": 0,
-            "models_used": {},
-            "extraction_methods_used": {},
-            "last_conversion": None
-        }
+        if stats is None:
+            stats = copy.deepcopy(_DEFAULT_STATS)
+        
+        # Usage tallies are Counters in memory and plain objects on disk
+        stats["models_used"] = Counter(stats.get("models_used") or {})
+        stats["extraction_methods_used"] = Counter(stats.get("extraction_methods_used") or {})
+        return stats
     
     def save_stats(self):
-        """Save statistics to file"""
-        try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
-        except Exception as e:
-            logger.warning(f"Failed to save stats: {e}")
+        """Save statistics to file atomically"""
+        tmp_file = f"{self.stats_file}.tmp"
+        with self._state["lock"]:
+            last_ts = self.stats.get("last_conversion_ts")
+            if last_ts is not None:
+                self.stats["last_conversion"] = datetime.fromtimestamp(last_ts).isoformat()
+            try:
+                if orjson:
+                    with open(tmp_file, 'wb') as f:
+                        f.write(orjson.dumps(self.stats, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(tmp_file, 'w') as f:
+                        json.dump(self.stats, f, indent=2)
+                os.replace(tmp_file, self.stats_file)
+                self._state["pending"] = 0
+            except Exception as e:
+                logger.warning(f"Failed to save stats: {e}")
+    
+    def flush(self):
+        """Save statistics if there are records not yet written to disk"""
+        with self._state["lock"]:
+            if self._state["pending"]:
+                self.save_stats()
     
     def record_conversion(self, success=True, pages=0, processing_time=0, 
                          model_used=None, extraction_method=None):
         """Record a conversion attempt"""
-        self.stats["total_conversions"] += 1
+        with self._state["lock"]:
+            self.stats["total_conversions"] += 1
         
-        if success:
-            self.stats["successful_conversions"] += 1
-            self.stats["total_pages_processed"] += pages
+            if success:
+                self.stats["successful_conversions"] += 1
+                self.stats["total_pages_processed"] += pages
             
-            # Update average processing time
-            if self.stats["successful_conversions"] > 1:
+                # Update average processing time incrementally (the first
+                # conversion simply replaces the initial average)
+                count = self.stats["successful_conversions"]
                 current_avg = self.stats["average_processing_time"]
-                new_avg = ((current_avg * (self.stats["successful_conversions"] - 1)) + processing_time) / self.stats["successful_conversions"]
-                self.stats["average_processing_time"] = new_avg
+                self.stats["average_processing_time"] = current_avg + (processing_time - current_avg) / count
             else:
-                self.stats["average_processing_time"] = processing_time
-        else:
-            self.stats["failed_conversions"] += 1
+                self.stats["failed_conversions"] += 1
+        
+            # Track model usage
+            if model_used:
+                self.stats["models_used"][model_used] += 1
         
-        # Track model usage
-        if model_used:
-            if model_used not in self.stats["models_used"]:
-                self.stats["models_used"][model_used] = 0
-            self.stats["models_used"][model_used] += 1
+            # Track extraction method usage
+            if extraction_method:
+                self.stats["extraction_methods_used"][extraction_method] += 1
         
-        # Track extraction method usage
-        if extraction_method:
-            if extraction_method not in self.stats["extraction_methods_used"]:
-                self.stats["extraction_methods_used"][extraction_method] = 0
-            self.stats["extraction_methods_used"][extraction_method] += 1
+            # Stored as an epoch; the ISO form is rendered when the stats are saved
+            self.stats["last_conversion_ts"] = time.time()
         
-        self.stats["last_conversion"] = datetime.now().isoformat()
-        self.save_stats()
+            self._state["pending"] += 1
+            if self._state["pending"] >= _STATS_FLUSH_EVERY:
+                self.save_stats()
     
     def get_success_rate(self):
         """Calculate success rate percentage"""
@@ -97,51 +172,141 @@ class ConversionStats:
 • Failed: {self.stats['failed_conversions']}
 • Pages processed: {self.stats['total_pages_processed']}
 • Average time: {self.stats['average_processing_time']:.1f}s
-• Most used model: {max(self.stats['models_used'], key=self.stats['models_used'].get) if self.stats['models_used'] else 'None'}
+• Most used model: {self.stats['models_used'].most_common(1)[0][0] if self.stats['models_used'] else 'None'}
 """
 
+class PageCache:
+    """Persistent cache of extracted and Gemini-processed text keyed by content hash"""
+    
+    def __init__(self, cache_file=".pdf2word_cache.db"):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._conn = None
+        try:
+            self._conn = sqlite3.connect(cache_file, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, text TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to open page cache, caching disabled: {e}")
+            self._conn = None
+    
+    @staticmethod
+    def make_key(text, model_name, version):
+        """Build a cache key from the page text, the model that processes it and a prompt version"""
+        return hashlib.sha256(f"{model_name}\0{version}\0{text}".encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def hash_file(file_path):
+        """Hash a file's bytes, reading it in 1 MB blocks"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def make_file_key(file_hash, model_name, version, extraction_version):
+        """Build a whole-document cache key from a file hash, the model, a prompt version and an extraction version"""
+        return f"file:{model_name}:{version}:{extraction_version}:{file_hash}"
+    
+    @staticmethod
+    def make_pages_key(file_hash, version):
+        """Build a cache key for a file's extracted pages from its hash and an extraction version"""
+        return f"pages:{version}:{file_hash}"
+    
+    def get(self, key):
+        """Return cached text for key, or None on a miss"""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT text FROM pages WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read page cache: {e}")
+            return None
+        return row[0] if row else None
+    
+    def set(self, key, text):
+        """Store processed text under key"""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("INSERT OR REPLACE INTO pages (key, text) VALUES (?, ?)", (key, text))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write page cache: {e}")
+    
+    def get_pages(self, key):
+        """Return a cached list of page texts for key, or None on a miss"""
+        data = self.get(key)
+        if data is None:
+            return None
+        try:
+            return orjson.loads(data) if orjson else json.loads(data)
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable cached pages: {e}")
+            return None
+    
+    def set_pages(self, key, pages):
+        """Store a list of page texts under key"""
+        self.set(key, orjson.dumps(pages).decode('utf-8') if orjson else json.dumps(pages))
+    
+    def close(self):
+        """Close the underlying database"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
 class DocumentAnalyzer:
     """Analyze document structure and provide insights"""
     
     @staticmethod
     def analyze_text_structure(text):
         """Analyze text structure and provide insights"""
-        lines = text.split('\n')
-        
-        analysis = {
-            "total_lines": len(lines),
-            "non_empty_lines": len([l for l in lines if l.strip()]),
-            "potential_headings": 0,
-            "paragraphs": 0,
-            "word_count": 0,
-            "character_count": len(text),
-            "average_line_length": 0,
-            "structure_quality": "Unknown"
-        }
-        
-        # Count words
-        words = text.split()
-        analysis["word_count"] = len(words)
-        
-        # Analyze line structure
-        non_empty_lines = [l for l in lines if l.strip()]
-        if non_empty_lines:
-            analysis["average_line_length"] = sum(len(l) for l in non_empty_lines) / len(non_empty_lines)
+        total_lines = 0
+        non_empty_lines = 0
+        total_length = 0
+        word_count = 0
+        potential_headings = 0
+        paragraphs = 0
         
-        # Count potential headings and paragraphs
-        for line in lines:
-            line = line.strip()
+        # Single pass over the lines: count, measure and classify together.
+        # Words are counted per line, so no list of every word in the text
+        # is ever built.
+        for raw_line in text.split('\n'):
+            total_lines += 1
+            line = raw_line.strip()
             if not line:
                 continue
-                
+            
+            non_empty_lines += 1
+            total_length += len(raw_line)
+            word_count += len(line.split())
+            
             # Potential heading detection
-            if (len(line) < 80 and 
-                (line.isupper() or 
-                 line.endswith(':') or
-                 any(line.startswith(prefix) for prefix in ['Chapter', 'Section', 'Part']))):
-                analysis["potential_headings"] += 1
+            # Constant-time checks run before the O(n) isupper() scan, which is
+            # skipped outright when the line starts with a lowercase letter
+            if (len(line) < 80 and
+                (line.endswith(':') or
+                 line.startswith(_HEADING_PREFIXES) or
+                 (not line[0].islower() and line.isupper()))):
+                potential_headings += 1
             else:
-                analysis["paragraphs"] += 1
+                paragraphs += 1
+        
+        analysis = {
+            "total_lines": total_lines,
+            "non_empty_lines": non_empty_lines,
+            "potential_headings": potential_headings,
+            "paragraphs": paragraphs,
+            "word_count": word_count,
+            "character_count": len(text),
+            "average_line_length": total_length / non_empty_lines if non_empty_lines else 0,
+            "structure_quality": "Unknown"
+        }
         
         # Assess structure quality
         if analysis["potential_headings"] > 0 and analysis["paragraphs"] > 0:
@@ -185,27 +350,17 @@ class QualityChecker:
         issues = []
         
         # Check for merged words (common patterns)
-        merged_patterns = [
-            r'[a-z][A-Z]',  # camelCase
-            r'[a-zA-Z]\d',  # word+number
-            r'\d[a-zA-Z]',  # number+word
-            r'[.!?][A-Z]',  # punctuation+capital
-        ]
-        
-        import re
         total_issues = 0
-        for pattern in merged_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                total_issues += len(matches)
+        for pattern in _MERGED_RE:
+            total_issues += sum(1 for _ in pattern.finditer(text))
         
         if total_issues > 0:
             issues.append(f"Found {total_issues} potential spacing issues")
         
         # Check for excessive spaces
-        excessive_spaces = re.findall(r' {3,}', text)
+        excessive_spaces = sum(1 for _ in _EXCESS_SPACES_RE.finditer(text))
         if excessive_spaces:
-            issues.append(f"Found {len(excessive_spaces)} instances of excessive spacing")
+            issues.append(f"Found {excessive_spaces} instances of excessive spacing")
         
         return issues
     
@@ -215,22 +370,21 @@ class QualityChecker:
         issues = []
         
         # Check for garbled text
-        import re
-        garbled_patterns = [
-            r'[^\w\s\.,!?;:()\-\'\"]{3,}',  # 3+ special chars in a row
-            r'\w{50,}',  # Very long words (likely merged)
-        ]
-        
-        for pattern in garbled_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _GARBLED_RES:
+            matches = sum(1 for _ in pattern.finditer(text))
             if matches:
-                issues.append(f"Potential garbled text detected: {len(matches)} instances")
+                issues.append(f"Potential garbled text detected: {matches} instances")
         
         return issues
 
 def create_conversion_report(input_file, output_file, stats, analysis, quality_issues):
     """Create a detailed conversion report"""
-    report = f"""
+    try:
+        file_size = os.path.getsize(output_file)
+    except OSError:
+        file_size = 'Unknown'
+    
+    parts = [f"""
 # PDF to Word Conversion Report
 
 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -238,7 +392,7 @@ def create_conversion_report(input_file, output_file, stats, analysis, quality_i
 ## File Information
 - **Input:** {input_file}
 - **Output:** {output_file}
-- **File Size:** {os.path.getsize(output_file) if os.path.exists(output_file) else 'Unknown'} bytes
+- **File Size:** {file_size} bytes
 
 ## Document Analysis
 - **Total Lines:** {analysis['total_lines']}
@@ -249,16 +403,15 @@ def create_conversion_report(input_file, output_file, stats, analysis, quality_i
 - **Structure Quality:** {analysis['structure_quality']}
 - **Average Line Length:** {analysis['average_line_length']:.1f} characters
 
-## Quality Assessment
-"""
+## Quality Assessment"""]
     
     if quality_issues:
-        report += "**Issues Found:**\n"
-        for issue in quality_issues:
-            report += f"- {issue}\n"
+        parts.append("**Issues Found:**")
+        parts.extend(f"- {issue}" for issue in quality_issues)
     else:
-        report += "✅ No quality issues detected\n"
+        parts.append("✅ No quality issues detected")
     
-    report += f"\n{stats.get_summary()}"
+    parts.append("")
+    parts.append(stats.get_summary() if stats else "")
     
-    return report
+    return "\n".join(parts)
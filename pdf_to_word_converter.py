@@ -17,26 +17,320 @@ import pdfplumber
 import fitz  # PyMuPDF
 import io
 import re
+import mmap
+import asyncio
 import time
-from typing import Optional, List, Tuple
+import zipfile
+import threading
+import multiprocessing
+from xml.sax.saxutils import escape as xml_escape
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import repeat
+from typing import Optional, List, Tuple, Union, BinaryIO, Callable
 import logging
 
 # Import advanced features
 try:
-    from advanced_features import ConversionStats, DocumentAnalyzer, QualityChecker, create_conversion_report
+    from advanced_features import ConversionStats, DocumentAnalyzer, QualityChecker, PageCache, create_conversion_report
 except ImportError:
     # Fallback if advanced features not available
     ConversionStats = None
+    PageCache = None
     DocumentAnalyzer = None
     QualityChecker = None
     create_conversion_report = None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configure logging; LOG_LEVEL (e.g. DEBUG) overrides the default INFO level,
+# and per-chunk and per-method messages are only shown at DEBUG
+_log_level = getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), None)
+logging.basicConfig(level=_log_level if isinstance(_log_level, int) else logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Documents with fewer pages are extracted serially; below this the cost of
+# starting worker processes outweighs the parallel speedup
+_PARALLEL_EXTRACTION_MIN_PAGES = 16
+# Default cap on extraction worker processes: page extraction stops scaling
+# well beyond this, while every extra process pays its own startup and parse
+_DEFAULT_MAX_EXTRACTION_WORKERS = 6
+# An extractor yielding fewer characters than this per page on average has
+# probably missed text (e.g. an unusual font encoding), so the next one is tried
+_MIN_CHARS_PER_PAGE = 50
+
+# Gemini requests carry at most _GEMINI_PAGES_PER_REQUEST pages and
+# _GEMINI_CHUNK_CHARS characters, split on paragraph boundaries, and up to
+# _GEMINI_MAX_WORKERS requests are in flight at once. Each chunk tries at most
+# _GEMINI_MAX_ATTEMPTS models before falling back to the raw text.
+_GEMINI_CHUNK_CHARS = 12000
+_GEMINI_PAGES_PER_REQUEST = 8
+_GEMINI_MAX_WORKERS = 4
+_GEMINI_MAX_ATTEMPTS = 3
+
+# Part of every Gemini output cache key; bump it when _SYSTEM_PROMPT changes
+# so output produced with the old instructions is not reused
+_PROMPT_VERSION = 2
+# Part of every extracted pages and whole-document cache key; bump it when
+# extraction or the pre-AI spacing fixes change
+_EXTRACTION_VERSION = 2
+
+# Separates the pages batched into one Gemini request; the model is told to
+# keep it, so each page's output can be recovered from the response
+_PAGE_BREAK = '---PAGE-BREAK---'
+_PAGE_BREAK_RE = re.compile(r'\n{0,2}[ \t]*%s[ \t]*\n{0,2}' % re.escape(_PAGE_BREAK))
+
+# Heading detection prefixes, built once instead of on every line
+_MAJOR_HEADING_PREFIXES = ('CHAPTER', 'PART', 'SECTION I', 'APPENDIX')
+_SECONDARY_HEADING_PREFIXES = ('Chapter', 'Section', 'Part')
+_SUB_HEADING_PREFIXES = ('Introduction', 'Conclusion', 'Summary', 'Overview')
+_HEADING_PREFIXES = (
+    'CHAPTER', 'PART', 'SECTION', 'APPENDIX', 'INTRODUCTION', 'CONCLUSION',
+    'Chapter', 'Part', 'Section', 'Appendix', 'Introduction', 'Conclusion',
+    'Summary', 'Overview', 'Abstract', 'References', 'Bibliography'
+)
+# One match for "starts with a heading word or is numbered 1.-20.", with the
+# numbered case captured; sub-numbered lines (1.1-10.10) start with a
+# numbered prefix too
+_HEADING_START_RE = re.compile(r'(?:%s|(?P<numbered>(?:1\d|20|[1-9])\.))' % '|'.join(_HEADING_PREFIXES))
+
+
+# PyMuPDF text extraction flags: the plain-text defaults, explicitly without
+# image blocks, which are never used
+_PYMUPDF_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Spacing fixes, compiled once per process. Each fix that only inserts a space
+# is written as a zero-width match, so several can share one pass over the
+# text with ' ' as the replacement. The character-transition fixes run once,
+# after AI processing; the merges and hyphen fixes run before it, as hints
+_SPLIT_MERGED_RE = re.compile(
+    r'(?<=[a-z])(?=[A-Z])'  # camelCase
+    r'|(?<=[a-zA-Z])(?=\d)'  # word followed by number
+    r'|(?<=\d)(?=[a-zA-Z])'  # number followed by word
+)
+_PUNCT_SPACING_RE = re.compile(
+    r'(?<=[.!?])(?=[A-Z])'  # punctuation followed by capital
+    r'|(?<=[,;:])(?=[a-zA-Z])'  # punctuation followed by letter
+)
+_MULTIPLE_SPACES_RE = re.compile(r' {2,}')
+_HYPHEN_NEWLINE_RE = re.compile(r'([a-z])-\n([a-z])')
+
+# Common merged words (add more as needed), matched case-insensitively
+_COMMON_MERGES = {
+    'andthe': 'and the',
+    'ofthe': 'of the',
+    'inthe': 'in the',
+    'tothe': 'to the',
+    'forthe': 'for the',
+    'withthe': 'with the',
+    'onthe': 'on the',
+    'atthe': 'at the',
+    'bythe': 'by the',
+    'fromthe': 'from the',
+    'thatthe': 'that the',
+    'thisthe': 'this the',
+    'itis': 'it is',
+    'thisis': 'this is',
+    'thereis': 'there is',
+    'therefor': 'therefore',
+    'however': 'however',
+    'moreover': 'moreover',
+    'furthermore': 'furthermore',
+}
+# The lookahead on first letters lets the scan skip most positions without
+# trying every alternative; entries are escaped so the table may hold any text
+_COMMON_MERGES_RE = re.compile(
+    '(?=[%s])(?:%s)' % (
+        ''.join(sorted({re.escape(merged[0]) for merged in _COMMON_MERGES})),
+        '|'.join(map(re.escape, _COMMON_MERGES)),
+    ),
+    re.IGNORECASE
+)
+# Where the space goes in merges that only need one, so the matched text keeps
+# its case ("AndThe" -> "And The"); -1 marks entries kept as they are
+_COMMON_MERGE_SPACES = {
+    merged: separated.find(' ')
+    for merged, separated in _COMMON_MERGES.items()
+    if separated.replace(' ', '', 1) == merged
+}
+
+
+# Instructions sent to Gemini as the system instruction. Keeping them out of
+# the request contents gives every request the same prefix, so Gemini's
+# implicit context caching can reuse it across chunks and documents.
+_SYSTEM_PROMPT = """You are an expert text processor. Clean up the PDF-extracted text you are given with EXTREME attention to word spacing:
+
+CRITICAL SPACING RULES:
+1. **MERGED WORDS**: Look for words stuck together and separate them properly
+   - Example: "thequick" → "the quick"
+   - Example: "andthe" → "and the"
+   - Example: "itis" → "it is"
+   - Example: "therefor" → "therefore"
+
+2. **MISSING SPACES**: Add spaces where words are clearly merged
+   - Between articles and nouns: "thedog" → "the dog"
+   - Between prepositions: "inthe" → "in the"
+   - Before capital letters: "wordAnother" → "word Another"
+   - Between numbers and words: "5years" → "5 years"
+
+3. **PRESERVE CORRECT SPACING**: Don't add extra spaces where they already exist correctly
+
+4. **OTHER FIXES**:
+   - Fix obvious OCR errors
+   - Maintain paragraph structure
+   - Fix punctuation spacing: "word.Another" → "word. Another"
+   - Remove random line breaks within sentences
+   - Keep original meaning and structure
+
+5. **DO NOT**:
+   - Add titles or headers
+   - Change the document structure
+   - Add commentary or explanations
+
+6. **PAGE BREAKS**: Keep every ---PAGE-BREAK--- line exactly as it is, on its own line
+
+EXAMPLES OF SPACING FIXES:
+- "Thisisanimportantdocument" → "This is an important document"
+- "Thecompanyreported5milliondollars" → "The company reported 5 million dollars"
+- "However,theresults" → "However, the results"
+
+Return ONLY the corrected text with proper spacing."""
+
+
+def _separate_merge(match) -> str:
+    """Replacement callback for _COMMON_MERGES_RE"""
+    merged = match.group(0)
+    space_at = _COMMON_MERGE_SPACES.get(merged.lower())
+    if space_at is None:
+        return _COMMON_MERGES[merged.lower()]
+    if space_at < 0:
+        return merged
+    return f'{merged[:space_at]} {merged[space_at:]}'
+
+
+def _fix_common_merges(text: str) -> str:
+    """Apply the spacing fixes run before AI processing, as hints for the model"""
+    # Fix common merged words in a single pass
+    processed_text = _COMMON_MERGES_RE.sub(_separate_merge, text)
+
+    # Fix line breaks that split words (the substring test is a plain C
+    # scan, much cheaper than running the regex over clean text)
+    if '-\n' in processed_text:
+        processed_text = _HYPHEN_NEWLINE_RE.sub(r'\1\2', processed_text)
+
+    return processed_text
+
+
+def _normalize_spacing(text: str) -> Tuple[str, int]:
+    """
+    Apply the character-transition spacing fixes run after AI processing
+
+    Returns the fixed text and the number of corrections made. Runs of
+    spaces are always collapsed, but are not counted as corrections.
+    """
+    # Add space before capital letters in merged words (camelCase) and
+    # between words and numbers
+    processed_text, split_count = _SPLIT_MERGED_RE.subn(' ', text)
+
+    # Fix punctuation spacing
+    processed_text, punct_count = _PUNCT_SPACING_RE.subn(' ', processed_text)
+
+    # Clean up multiple spaces
+    processed_text = _MULTIPLE_SPACES_RE.sub(' ', processed_text)
+
+    return processed_text, split_count + punct_count
+
+
+# Characters XML 1.0 cannot represent; splitlines() already breaks lines on
+# the others in the control range
+_INVALID_XML_CHARS_RE = re.compile('[\x00-\x08\x0e-\x1b\x1f\ud800-\udfff\ufffe\uffff]')
+
+# Package parts of an empty python-docx document, captured once per process:
+# (name, data) pairs in package order, with None as the data of the main
+# document part, plus that part split around the point where the body goes
+_docx_template = None
+
+
+def _get_docx_template() -> Tuple[List[Tuple[str, Optional[bytes]]], bytes, bytes]:
+    """Return the empty document's parts and the document part's prefix and suffix"""
+    global _docx_template
+    if _docx_template is None:
+        buffer = io.BytesIO()
+        Document().save(buffer)
+        parts = []
+        with zipfile.ZipFile(buffer) as package:
+            for name in package.namelist():
+                parts.append((name, None if name == 'word/document.xml' else package.read(name)))
+            document_xml = package.read('word/document.xml')
+        # Paragraphs go before the section properties, which end the body
+        split_at = document_xml.index(b'<w:sectPr')
+        _docx_template = (parts, document_xml[:split_at], document_xml[split_at:])
+    return _docx_template
+
+
+def _paragraph_xml(text: str, style_id: Optional[str] = None) -> str:
+    """
+    Build a WordprocessingML paragraph holding text in a single run
+
+    Tabs become <w:tab/> elements, as python-docx's run text setter does.
+    """
+    run_text = xml_escape(text).replace('\t', '</w:t><w:tab/><w:t xml:space="preserve">')
+    properties = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>' if style_id else ''
+    return f'<w:p>{properties}<w:r><w:t xml:space="preserve">{run_text}</w:t></w:r></w:p>'
+
+
+def _extract_page_range_pymupdf(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages [start, stop) with PyMuPDF
+
+    Module-level so it can run in a worker process. MuPDF documents are not
+    thread-safe, so each worker opens its own handle instead of sharing one.
+    """
+    with fitz.open(pdf_path) as doc:
+        return _pymupdf_page_texts(doc, start, stop)
+
+
+def _pymupdf_page_texts(doc, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) of an open PyMuPDF document"""
+    page_texts = []
+    for page_num in range(start, stop):
+        page = doc.load_page(page_num)
+        # A page with no content stream and no annotations has no text;
+        # skip building a TextPage for it
+        if not page.get_contents() and page.first_annot is None and page.first_widget is None:
+            page_texts.append("")
+            continue
+        page_texts.append(page.get_text("text", flags=_PYMUPDF_TEXT_FLAGS))
+    return page_texts
+
+
+def _pdfplumber_page_text(page) -> str:
+    """
+    Extract a pdfplumber page's text, then release the objects parsed for it
+
+    pdfplumber keeps every page's characters cached until the document is
+    closed, which dominates memory on long PDFs. Older releases only have
+    flush_cache(); close() also drops the cached text map.
+    """
+    try:
+        return page.extract_text() or ""
+    finally:
+        getattr(page, 'close', page.flush_cache)()
+
+
+def _extract_page_range_pdfplumber(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages [start, stop) with pdfplumber
+
+    Module-level so it can run in a worker process; only the requested pages
+    are loaded.
+    """
+    with pdfplumber.open(pdf_path, pages=list(range(start + 1, stop + 1))) as pdf:
+        return [_pdfplumber_page_text(page) for page in pdf.pages]
+
+
 class PDFToWordConverter:
-    def __init__(self, api_key: str, preferred_model: str = None, enable_stats: bool = True):
+    def __init__(self, api_key: str, preferred_model: str = None, enable_stats: bool = True,
+                 enable_cache: bool = True, workers: Optional[int] = None,
+                 gemini_concurrency: Optional[int] = None):
         """
         Initialize the converter with Gemini API key
 
@@ -44,13 +338,25 @@ class PDFToWordConverter:
             api_key (str): Google Gemini API key
             preferred_model (str, optional): Preferred model to use
             enable_stats (bool): Enable conversion statistics tracking
+            enable_cache (bool): Reuse Gemini output for previously processed text
+            workers (int, optional): Processes used for page extraction (defaults to CPU count, at most 6)
+            gemini_concurrency (int, optional): Maximum Gemini requests in flight at once,
+                shared by every document this converter processes
         """
         self.api_key = api_key
         genai.configure(api_key=api_key)
 
         # Initialize statistics tracking
         self.stats = ConversionStats() if ConversionStats and enable_stats else None
+        self.cache = PageCache() if PageCache and enable_cache else None
         self.extraction_method_used = None
+        self.pages_processed = 0
+        self.workers = workers or min(os.cpu_count() or 1, _DEFAULT_MAX_EXTRACTION_WORKERS)
+        self.gemini_concurrency = max(1, gemini_concurrency or _GEMINI_MAX_WORKERS)
+        # Held around every request, so concurrent conversions (convert_many)
+        # and nested batches stay within gemini_concurrency between them;
+        # batch workers replace it with one semaphore shared across processes
+        self._gemini_slots = threading.BoundedSemaphore(self.gemini_concurrency)
 
         # Get all available models dynamically
         self.available_models = self._fetch_available_models()
@@ -64,6 +370,11 @@ class PDFToWordConverter:
 
         self.current_model = None
         self.current_model_name = None
+        self._model_cache = {}
+        self._model_lock = threading.Lock()
+        # PyMuPDF documents are not thread-safe, so conversions running in
+        # several threads (see convert_many) extract one at a time
+        self._extraction_lock = threading.Lock()
         self._initialize_model()
 
     def _fetch_available_models(self):
@@ -110,7 +421,7 @@ class PDFToWordConverter:
         """Initialize the best available model with fallback"""
         for model_name in self.model_names:
             try:
-                self.current_model = genai.GenerativeModel(model_name)
+                self.current_model = self._get_model(model_name)
                 self.current_model_name = model_name
                 logger.info(f"Successfully initialized model: {model_name}")
                 break
@@ -121,6 +432,18 @@ class PDFToWordConverter:
         if self.current_model is None:
             raise Exception("Failed to initialize any Gemini model")
 
+    def _get_model(self, model_name: str):
+        """Return the GenerativeModel for model_name, creating it on first use"""
+        model = self._model_cache.get(model_name)
+        if model is None:
+            with self._model_lock:
+                model = self._model_cache.get(model_name)
+                if model is None:
+                    model = self._model_cache[model_name] = genai.GenerativeModel(
+                        model_name, system_instruction=_SYSTEM_PROMPT
+                    )
+        return model
+
     def get_available_models(self):
         """Get list of all available models"""
         return self.available_models
@@ -139,285 +462,464 @@ class PDFToWordConverter:
         Returns:
             str: Extracted text content with proper spacing
         """
-        extraction_methods = [
-            ("pdfplumber", self._extract_with_pdfplumber),
-            ("PyMuPDF", self._extract_with_pymupdf),
-            ("PyPDF2", self._extract_with_pypdf2)
-        ]
+        return "\n\n".join(self.extract_pages_from_pdf(pdf_path)) + "\n\n"
 
-        for method_name, extraction_func in extraction_methods:
-            try:
-                logger.info(f"Trying extraction with {method_name}...")
-                text_content = extraction_func(pdf_path)
+    def extract_pages_from_pdf(self, pdf_path: str) -> List[str]:
+        """
+        Extract the text of each non-empty page, keeping page boundaries
 
-                if text_content and text_content.strip():
-                    logger.info(f"Successfully extracted text using {method_name}")
-                    self.extraction_method_used = method_name
+        Args:
+            pdf_path (str): Path to the PDF file
 
-                    # Apply preprocessing to fix spacing issues
-                    processed_text = self._preprocess_spacing(text_content)
-                    return processed_text
-                else:
-                    logger.warning(f"{method_name} returned empty text")
+        Returns:
+            List[str]: Extracted page texts with proper spacing
+        """
+        pages, self.extraction_method_used = self._extract_pages(pdf_path)
+        return pages
 
-            except Exception as e:
-                logger.warning(f"{method_name} extraction failed: {str(e)}")
-                continue
+    def _extract_pages(self, pdf_path: str) -> Tuple[List[str], str]:
+        """
+        Implementation of extract_pages_from_pdf
+
+        Returns:
+            Tuple[List[str], str]: Extracted page texts, and the name of the
+            method that extracted them
+        """
+        # Fail fast on inputs no extractor can read, instead of letting each
+        # library in the chain parse the file and fail in turn. The document
+        # opened for the check stays open for PyMuPDF extraction, so the file
+        # is only parsed once more if PyMuPDF hands pages to worker processes
+        try:
+            doc = fitz.open(pdf_path)
+        except Exception as e:
+            raise ValueError(f"Not a readable PDF file: {pdf_path} ({e})")
+        with doc:
+            if not doc.is_pdf:
+                raise ValueError(f"Not a PDF file: {pdf_path}")
+            if doc.needs_pass:
+                raise ValueError(f"PDF is password-protected: {pdf_path}")
+            page_count = doc.page_count
+
+            with open(pdf_path, 'rb') as pdf_file, \
+                    mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ) as pdf_data:
+                # PyMuPDF runs in C and is by far the fastest; pdfplumber is kept as
+                # the first fallback for its careful spacing. Both may hand pages
+                # to worker processes, which open the file by path, while PyPDF2
+                # reads the shared memory mapping instead of reopening the file.
+                extraction_methods = [
+                    ("PyMuPDF", self._extract_with_pymupdf, doc),
+                    ("pdfplumber", self._extract_with_pdfplumber, pdf_path),
+                    ("PyPDF2", self._extract_with_pypdf2, pdf_data)
+                ]
+
+                # The first method with enough text per page wins; if none has,
+                # the one that found the most text is used
+                best = None
+                for method_name, extraction_func, source in extraction_methods:
+                    try:
+                        logger.debug("Trying extraction with %s...", method_name)
+                        if source is pdf_data:
+                            pdf_data.seek(0)
+                        pages = extraction_func(source)
+                    except Exception as e:
+                        logger.warning(f"{method_name} extraction failed: {str(e)}")
+                        continue
+
+                    char_count = sum(len(page.strip()) for page in pages)
+                    if not char_count:
+                        logger.warning(f"{method_name} returned empty text")
+                        continue
+                    if best is None or char_count > best[0]:
+                        best = (char_count, method_name, pages)
+                    if char_count >= _MIN_CHARS_PER_PAGE * page_count:
+                        break
+                    logger.warning(f"{method_name} returned only {char_count} characters for {page_count} pages")
+
+        if best is None:
+            raise Exception("All PDF extraction methods failed")
+
+        _, method_name, pages = best
+        logger.info(f"Successfully extracted text using {method_name}")
 
-        raise Exception("All PDF extraction methods failed")
-
-    def _extract_with_pdfplumber(self, pdf_path: str) -> str:
-        """Extract text using pdfplumber (best for spacing)"""
-        text_content = ""
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    text_content += page_text + "\n\n"
-            logger.info(f"pdfplumber: Extracted text from {len(pdf.pages)} pages")
-        return text_content
-
-    def _extract_with_pymupdf(self, pdf_path: str) -> str:
-        """Extract text using PyMuPDF (good for complex layouts)"""
-        text_content = ""
-        doc = fitz.open(pdf_path)
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            page_text = page.get_text()
+        # Apply preprocessing to fix spacing issues
+        logger.debug("Applying intelligent spacing preprocessing...")
+        processed_pages = [_fix_common_merges(page) for page in pages]
+        logger.debug("Spacing preprocessing completed")
+        return processed_pages, method_name
+
+    def _use_parallel_extraction(self, page_count: int) -> bool:
+        """Whether a document of page_count pages is worth extracting in worker processes"""
+        return page_count >= _PARALLEL_EXTRACTION_MIN_PAGES and self.workers >= 2
+
+    def _extract_page_ranges(self, worker, pdf_path: str, page_count: int) -> List[str]:
+        """
+        Extract all pages with worker(pdf_path, start, stop) in a process pool
+
+        The pages are split into one contiguous range per worker process, and
+        the page texts are returned in document order.
+        """
+        workers = min(self.workers, page_count)
+        step = -(-page_count // workers)
+        starts = range(0, page_count, step)
+        stops = [min(start + step, page_count) for start in starts]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            ranges = executor.map(worker, repeat(pdf_path), starts, stops)
+            return [page_text for page_range in ranges for page_text in page_range]
+
+    def _extract_with_pdfplumber(self, source: Union[str, BinaryIO]) -> List[str]:
+        """Extract text using pdfplumber (careful spacing, but slow) from a path or binary stream"""
+        with pdfplumber.open(source) as pdf:
+            page_count = len(pdf.pages)
+            parallel = isinstance(source, str) and self._use_parallel_extraction(page_count)
+            if not parallel:
+                page_texts = [_pdfplumber_page_text(page) for page in pdf.pages]
+
+        if parallel:
+            page_texts = self._extract_page_ranges(_extract_page_range_pdfplumber, source, page_count)
+
+        logger.debug("pdfplumber: Extracted text from %d pages", page_count)
+        return [page_text for page_text in page_texts if page_text]
+
+    def _extract_with_pymupdf(self, doc) -> List[str]:
+        """Extract text using PyMuPDF (good for complex layouts) from an open document"""
+        page_count = doc.page_count
+        if self._use_parallel_extraction(page_count):
+            page_texts = self._extract_page_ranges(_extract_page_range_pymupdf, doc.name, page_count)
+        else:
+            page_texts = _pymupdf_page_texts(doc, 0, page_count)
+
+        logger.debug("PyMuPDF: Extracted text from %d pages", page_count)
+        return [page_text for page_text in page_texts if page_text]
+
+    def _extract_with_pypdf2(self, source: Union[str, BinaryIO]) -> List[str]:
+        """Extract text using PyPDF2 (fallback method) from a path or binary stream"""
+        parts = []
+        pdf_reader = PyPDF2.PdfReader(source)
+        logger.debug("PyPDF2: Extracting text from %d pages", len(pdf_reader.pages))
+        for page in pdf_reader.pages:
+            page_text = page.extract_text()
             if page_text:
-                text_content += page_text + "\n\n"
-        doc.close()
-        logger.info(f"PyMuPDF: Extracted text from {len(doc)} pages")
-        return text_content
-
-    def _extract_with_pypdf2(self, pdf_path: str) -> str:
-        """Extract text using PyPDF2 (fallback method)"""
-        text_content = ""
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                page_text = page.extract_text()
-                if page_text:
-                    text_content += page_text + "\n\n"
-            logger.info(f"PyPDF2: Extracted text from {len(pdf_reader.pages)} pages")
-        return text_content
+                parts.append(page_text)
+        return parts
 
     def _preprocess_spacing(self, text: str) -> str:
         """
         Intelligent preprocessing to fix common spacing issues before AI processing
         """
-        logger.info("Applying intelligent spacing preprocessing...")
-
-        # Fix merged words with common patterns
-        processed_text = text
-
-        # Pattern 1: Add space before capital letters in merged words (camelCase)
-        # But avoid breaking acronyms or proper nouns
-        processed_text = re.sub(r'([a-z])([A-Z])', r'\1 \2', processed_text)
-
-        # Pattern 2: Add space between word and number
-        processed_text = re.sub(r'([a-zA-Z])(\d)', r'\1 \2', processed_text)
-        processed_text = re.sub(r'(\d)([a-zA-Z])', r'\1 \2', processed_text)
-
-        # Pattern 3: Fix common merged words (add more as needed)
-        common_merges = {
-            r'andthe': 'and the',
-            r'ofthe': 'of the',
-            r'inthe': 'in the',
-            r'tothe': 'to the',
-            r'forthe': 'for the',
-            r'withthe': 'with the',
-            r'onthe': 'on the',
-            r'atthe': 'at the',
-            r'bythe': 'by the',
-            r'fromthe': 'from the',
-            r'thatthe': 'that the',
-            r'thisthe': 'this the',
-            r'itis': 'it is',
-            r'thisis': 'this is',
-            r'thereis': 'there is',
-            r'therefor': 'therefore',
-            r'however': 'however',
-            r'moreover': 'moreover',
-            r'furthermore': 'furthermore',
-        }
-
-        for merged, separated in common_merges.items():
-            processed_text = re.sub(merged, separated, processed_text, flags=re.IGNORECASE)
-
-        # Pattern 4: Fix punctuation spacing
-        processed_text = re.sub(r'([.!?])([A-Z])', r'\1 \2', processed_text)
-        processed_text = re.sub(r'([,;:])([a-zA-Z])', r'\1 \2', processed_text)
-
-        # Pattern 5: Clean up multiple spaces
-        processed_text = re.sub(r' +', ' ', processed_text)
-
-        # Pattern 6: Fix line breaks that split words
-        processed_text = re.sub(r'([a-z])-\n([a-z])', r'\1\2', processed_text)
-
-        logger.info("Spacing preprocessing completed")
+        logger.debug("Applying intelligent spacing preprocessing...")
+
+        processed_text = _fix_common_merges(text)
+
+        logger.debug("Spacing preprocessing completed")
         return processed_text
 
-    def process_with_gemini(self, text_content: str) -> str:
+    def _chunk_text(self, text: str, max_chars: int = _GEMINI_CHUNK_CHARS) -> List[str]:
+        """
+        Split text into chunks of at most max_chars on paragraph boundaries
+
+        A single paragraph longer than max_chars is kept whole as its own chunk.
+        """
+        chunks = []
+        current = []
+        current_len = 0
+        for paragraph in text.split('\n\n'):
+            if current and current_len + len(paragraph) > max_chars:
+                chunks.append('\n\n'.join(current))
+                current = []
+                current_len = 0
+            current.append(paragraph)
+            current_len += len(paragraph) + 2
+        if current:
+            chunks.append('\n\n'.join(current))
+        return chunks
+
+    def _batch_pages(self, pages: List[str], max_pages: int = _GEMINI_PAGES_PER_REQUEST,
+                     max_chars: int = _GEMINI_CHUNK_CHARS) -> List[str]:
+        """
+        Group consecutive pages into chunks of at most max_pages pages and
+        max_chars characters
+
+        Pages within a chunk are separated by _PAGE_BREAK markers. A page
+        longer than max_chars is split on paragraph boundaries instead.
+        """
+        page_separator = f'\n\n{_PAGE_BREAK}\n\n'
+        chunks = []
+        current = []
+        current_len = 0
+        for page in pages:
+            if current and (len(current) >= max_pages or current_len + len(page) > max_chars):
+                chunks.append(page_separator.join(current))
+                current = []
+                current_len = 0
+            if len(page) > max_chars:
+                chunks.extend(self._chunk_text(page, max_chars))
+                continue
+            current.append(page)
+            current_len += len(page) + len(page_separator)
+        if current:
+            chunks.append(page_separator.join(current))
+        return chunks
+
+    def process_with_gemini(self, text_content: Union[str, List[str]]) -> str:
         """
         Process extracted text with Gemini API for better formatting with model fallback
 
+        Large documents are split into page batches (or paragraph-aligned chunks
+        for plain text) that are sent to Gemini concurrently and stitched back
+        together in order.
+
         Args:
-            text_content (str): Raw text extracted from PDF
+            text_content (str or List[str]): Raw text or page texts extracted from PDF
 
         Returns:
             str: Processed and formatted text
         """
-        prompt = f"""
-You are an expert text processor. Clean up this PDF-extracted text with EXTREME attention to word spacing:
+        return self._process_with_gemini(text_content)[0]
 
-CRITICAL SPACING RULES:
-1. **MERGED WORDS**: Look for words stuck together and separate them properly
-   - Example: "thequick" → "the quick"
-   - Example: "andthe" → "and the"
-   - Example: "itis" → "it is"
-   - Example: "therefor" → "therefore"
-
-2. **MISSING SPACES**: Add spaces where words are clearly merged
-   - Between articles and nouns: "thedog" → "the dog"
-   - Between prepositions: "inthe" → "in the"
-   - Before capital letters: "wordAnother" → "word Another"
-   - Between numbers and words: "5years" → "5 years"
+    def _process_with_gemini(self, text_content: Union[str, List[str]],
+                             progress_callback: Optional[Callable[[int, int], None]] = None
+                             ) -> Tuple[str, bool]:
+        """
+        Implementation of process_with_gemini
 
-3. **PRESERVE CORRECT SPACING**: Don't add extra spaces where they already exist correctly
+        Args:
+            text_content (str or List[str]): Raw text or page texts extracted from PDF
+            progress_callback (callable, optional): Called with (chunks done,
+                total chunks) on the calling thread as each chunk finishes
 
-4. **OTHER FIXES**:
-   - Fix obvious OCR errors
-   - Maintain paragraph structure
-   - Fix punctuation spacing: "word.Another" → "word. Another"
-   - Remove random line breaks within sentences
-   - Keep original meaning and structure
+        Returns:
+            Tuple[str, bool]: Processed text, and whether every chunk was
+            processed by the primary model and may be reused
+        """
+        if isinstance(text_content, list):
+            chunks = self._batch_pages(text_content)
+        else:
+            chunks = self._chunk_text(text_content)
+        if not chunks:
+            return "", True
+        if len(chunks) == 1:
+            text, reusable = self._process_chunk(chunks[0])
+            if progress_callback:
+                progress_callback(1, 1)
+            return '\n\n'.join(self._split_pages(text)), reusable
+
+        logger.info(f"Processing {len(chunks)} text chunks with Gemini...")
+        # Requests are blocking network I/O, so threads overlap them well; the
+        # SDK's async client is bound to the first event loop that uses it,
+        # which rules out a fresh asyncio.run() per document
+        with ThreadPoolExecutor(max_workers=min(self.gemini_concurrency, len(chunks))) as executor:
+            futures = [executor.submit(self._process_chunk, chunk) for chunk in chunks]
+            if progress_callback:
+                for done, _ in enumerate(as_completed(futures), 1):
+                    progress_callback(done, len(chunks))
+            results = [future.result() for future in futures]
+        pages = [page for text, _ in results for page in self._split_pages(text)]
+        return '\n\n'.join(pages), all(reusable for _, reusable in results)
+
+    def process_batch(self, texts: List[str]) -> List[str]:
+        """
+        Process several independent texts, sharing Gemini requests between them
 
-5. **DO NOT**:
-   - Add titles or headers
-   - Change the document structure
-   - Add commentary or explanations
+        Short texts are sent together, separated by _PAGE_BREAK markers as
+        document pages are, so a handful of small texts costs one request.
+        A text longer than a request holds is processed on its own; if a
+        response does not keep every marker, that group's texts are
+        processed one request each instead.
 
-EXAMPLES OF SPACING FIXES:
-- "Thisisanimportantdocument" → "This is an important document"
-- "Thecompanyreported5milliondollars" → "The company reported 5 million dollars"
-- "However,theresults" → "However, the results"
+        Args:
+            texts (List[str]): Raw texts to process
 
-Text to process:
-{text_content}
+        Returns:
+            List[str]: Processed texts, in the order given
+        """
+        page_separator = f'\n\n{_PAGE_BREAK}\n\n'
+        groups = []
+        current = []
+        current_len = 0
+        for i, text in enumerate(texts):
+            if len(text) > _GEMINI_CHUNK_CHARS:
+                groups.append([i])
+                continue
+            if current and (len(current) >= _GEMINI_PAGES_PER_REQUEST or
+                            current_len + len(text) > _GEMINI_CHUNK_CHARS):
+                groups.append(current)
+                current = []
+                current_len = 0
+            current.append(i)
+            current_len += len(text) + len(page_separator)
+        if current:
+            groups.append(current)
+        if not groups:
+            return []
+
+        def process_group(indices: List[int]) -> List[str]:
+            if len(indices) == 1:
+                return [self.process_with_gemini(texts[indices[0]])]
+            processed, _ = self._process_chunk(page_separator.join(texts[i] for i in indices))
+            parts = self._split_pages(processed)
+            if len(parts) == len(indices):
+                return parts
+            logger.warning(f"Batched response lost text boundaries, processing {len(indices)} texts separately")
+            return [self.process_with_gemini(texts[i]) for i in indices]
+
+        with ThreadPoolExecutor(max_workers=min(self.gemini_concurrency, len(groups))) as executor:
+            group_results = list(executor.map(process_group, groups))
+
+        results = [""] * len(texts)
+        for indices, parts in zip(groups, group_results):
+            for i, part in zip(indices, parts):
+                results[i] = part
+        return results
+
+    def _split_pages(self, text: str) -> List[str]:
+        """Split a processed chunk back into its pages on the _PAGE_BREAK markers"""
+        if _PAGE_BREAK not in text:
+            return [text]
+        return _PAGE_BREAK_RE.split(text)
+
+    def _process_chunk(self, text_content: str) -> Tuple[str, bool]:
+        """
+        Process a single chunk of text with Gemini, falling back through the
+        available models so one failing chunk doesn't fail the whole document
 
-Return ONLY the corrected text with proper spacing:"""
+        Args:
+            text_content (str): Chunk of raw text
 
-        # Try models in fallback order
-        for i, model_name in enumerate(self.model_names):
+        Returns:
+            Tuple[str, bool]: Processed chunk (or the original chunk if all
+            models fail), and whether it came from the primary model
+        """
+        primary_model_name = self.current_model_name
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(text_content, primary_model_name, _PROMPT_VERSION)
+            cached_text = self.cache.get(cache_key)
+            if cached_text is not None:
+                logger.debug("Reusing cached Gemini output for unchanged chunk")
+                return cached_text, True
+
+        # Try the active model first, then the next models in fallback order
+        model_names = [primary_model_name] + [m for m in self.model_names if m != primary_model_name]
+        model_names = model_names[:_GEMINI_MAX_ATTEMPTS]
+        for i, model_name in enumerate(model_names):
             try:
-                model = genai.GenerativeModel(model_name)
-                response = model.generate_content(prompt)
-                logger.info(f"Text processed successfully with {model_name}")
-                return response.text
+                model = self._get_model(model_name)
+                with self._gemini_slots:
+                    response = model.generate_content(text_content)
+                logger.debug("Text processed successfully with %s", model_name)
+
+                if model_name == primary_model_name:
+                    if cache_key:
+                        self.cache.set(cache_key, response.text)
+                elif self.current_model_name == primary_model_name:
+                    # Keep using the working fallback so later chunks skip the failed model
+                    logger.info(f"Switching active model to {model_name}")
+                    self.current_model = model
+                    self.current_model_name = model_name
+                return response.text, model_name == primary_model_name
 
             except Exception as e:
                 logger.warning(f"Failed to process with {model_name}: {str(e)}")
-                if i < len(self.model_names) - 1:
-                    logger.info(f"Falling back to next model...")
+                if i < len(model_names) - 1:
+                    logger.debug("Falling back to next model...")
                     continue
                 else:
-                    logger.error("All models failed, returning original text")
-                    return text_content
+                    logger.error(f"All {len(model_names)} attempted models failed, returning original chunk text")
+                    return text_content, False
 
-        return text_content
+        return text_content, False
 
     def _post_process_spacing(self, text: str) -> str:
         """
         Final validation and fixing of spacing issues after AI processing
         """
-        logger.info("Applying post-processing spacing validation...")
-
-        processed_text = text
-
-        # Check for remaining merged words using common patterns
-        suspicious_patterns = [
-            r'[a-z][A-Z]',  # camelCase
-            r'[a-zA-Z]\d',  # word followed by number
-            r'\d[a-zA-Z]',  # number followed by word
-            r'[.!?][A-Z]',  # punctuation followed by capital
-            r'[,;:][a-zA-Z]',  # punctuation followed by letter
-        ]
-
-        issues_found = 0
-        for pattern in suspicious_patterns:
-            matches = re.findall(pattern, processed_text)
-            if matches:
-                issues_found += len(matches)
+        logger.debug("Applying post-processing spacing validation...")
 
-        if issues_found > 0:
-            logger.warning(f"Found {issues_found} potential spacing issues in post-processing")
+        # The character-transition fixes run only here, once over the final
+        # text, and also cover raw text kept when AI processing fails
+        processed_text, correction_count = _normalize_spacing(text)
 
-            # Apply final fixes
-            processed_text = re.sub(r'([a-z])([A-Z])', r'\1 \2', processed_text)
-            processed_text = re.sub(r'([a-zA-Z])(\d)', r'\1 \2', processed_text)
-            processed_text = re.sub(r'(\d)([a-zA-Z])', r'\1 \2', processed_text)
-            processed_text = re.sub(r'([.!?])([A-Z])', r'\1 \2', processed_text)
-            processed_text = re.sub(r'([,;:])([a-zA-Z])', r'\1 \2', processed_text)
-
-            # Clean up multiple spaces
-            processed_text = re.sub(r' +', ' ', processed_text)
-
-            logger.info("Applied final spacing corrections")
+        if correction_count:
+            logger.warning("Found potential spacing issues in post-processing")
+            logger.debug("Applied %d final spacing corrections", correction_count)
         else:
-            logger.info("No spacing issues detected in post-processing")
+            logger.debug("No spacing issues detected in post-processing")
 
         return processed_text
 
-    def _detect_heading_level(self, text: str) -> int:
+    def _classify_heading(self, text: str) -> Optional[int]:
         """
-        Intelligently detect heading level based on text patterns
+        Classify a line in one pass: its heading level (1-3), or None when it
+        is body text
         """
         text = text.strip()
 
+        # Skip very long lines
+        if len(text) > 100:
+            return None
+
+        ends_with_colon = text.endswith(':') and len(text) < 50
+
+        # Most body lines start lowercase; no heading word, number or all-caps
+        # line does, so only a closing colon is left to check
+        if text[:1].islower():
+            return 2 if ends_with_colon else None
+
+        all_caps = len(text) < 60 and text.isupper()
+
+        # Heading word, numbered or sub-numbered start, colon or all caps
+        start = _HEADING_START_RE.match(text)
+        if not ends_with_colon and start is None:
+            return 1 if all_caps else None
+
         # Level 1: Major headings
-        if (text.isupper() and len(text) < 60) or \
-           any(text.startswith(prefix) for prefix in ['CHAPTER', 'PART', 'SECTION I', 'APPENDIX']):
+        if all_caps or text.startswith(_MAJOR_HEADING_PREFIXES):
             return 1
 
-        # Level 2: Secondary headings
-        if text.startswith(('Chapter', 'Section', 'Part')) or \
-           (text.endswith(':') and len(text) < 50) or \
-           any(text.startswith(f'{i}.') for i in range(1, 21)):
+        # Level 2: Secondary headings, including numbered and sub-numbered ones
+        if ends_with_colon or (start is not None and start.group('numbered')) or \
+           text.startswith(_SECONDARY_HEADING_PREFIXES):
             return 2
 
         # Level 3: Sub-headings
-        if any(text.startswith(f'{i}.{j}') for i in range(1, 11) for j in range(1, 11)) or \
-           text.startswith(('Introduction', 'Conclusion', 'Summary', 'Overview')):
+        if text.startswith(_SUB_HEADING_PREFIXES):
             return 3
 
-        return 0  # Not a heading
+        # Other heading words get the top level
+        return 1
 
-    def _is_heading(self, text: str) -> bool:
+    def _iter_body_xml(self, processed_text: str):
         """
-        Enhanced heading detection with multiple criteria
+        Yield the WordprocessingML paragraphs of the document body in order
         """
-        text = text.strip()
+        paragraph_lines = []
+
+        # Single pass over the lines: headings and blank lines are emitted
+        # as they are seen, other lines accumulate into the current paragraph
+        for raw_line in _INVALID_XML_CHARS_RE.sub('', processed_text).splitlines():
+            line = raw_line.strip()
+
+            if not line:
+                # Empty line ends the paragraph and adds spacing
+                if paragraph_lines:
+                    yield _paragraph_xml(" ".join(paragraph_lines))
+                    paragraph_lines.clear()
+                yield '<w:p/>'
+                continue
 
-        # Skip very long lines
-        if len(text) > 100:
-            return False
-
-        # Check various heading patterns
-        heading_patterns = [
-            text.isupper() and len(text) < 60,  # All caps, reasonable length
-            text.endswith(':') and len(text) < 50,  # Ends with colon
-            any(text.startswith(prefix) for prefix in [
-                'CHAPTER', 'PART', 'SECTION', 'APPENDIX', 'INTRODUCTION', 'CONCLUSION',
-                'Chapter', 'Part', 'Section', 'Appendix', 'Introduction', 'Conclusion'
-            ]),
-            any(text.startswith(f'{i}.') for i in range(1, 21)),  # Numbered 1-20
-            any(text.startswith(f'{i}.{j}') for i in range(1, 11) for j in range(1, 11)),  # Sub-numbered
-            text.startswith(('Summary', 'Overview', 'Abstract', 'References', 'Bibliography'))
-        ]
+            level = self._classify_heading(line)
+            if level:
+                # Add heading with appropriate level
+                if paragraph_lines:
+                    yield _paragraph_xml(" ".join(paragraph_lines))
+                    paragraph_lines.clear()
+                yield _paragraph_xml(line, f"Heading{level}")
+            else:
+                # Regular paragraph line
+                paragraph_lines.append(line)
 
-        return any(heading_patterns)
+        if paragraph_lines:
+            yield _paragraph_xml(" ".join(paragraph_lines))
 
     def create_word_document(self, processed_text: str, output_path: str) -> None:
         """
@@ -428,73 +930,22 @@ Return ONLY the corrected text with proper spacing:"""
             output_path (str): Path for the output Word document
         """
         try:
-            doc = Document()
-
-            # Enhanced document structure analysis
-            lines = processed_text.split('\n')
-
-            # First pass: identify document structure
-            headings = []
-            for i, line in enumerate(lines):
-                if line.strip() and self._is_heading(line):
-                    level = self._detect_heading_level(line)
-                    headings.append((i, line.strip(), level))
-
-            # Second pass: build document with proper structure
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-
-                if not line:
-                    # Add spacing for empty lines
-                    doc.add_paragraph()
-                    i += 1
-                    continue
-
-                # Check if this line is a heading
-                is_heading_line = False
-                heading_level = 0
-
-                for heading_idx, heading_text, level in headings:
-                    if heading_idx == i:
-                        is_heading_line = True
-                        heading_level = level
-                        break
-
-                if is_heading_line:
-                    # Add heading with appropriate level
-                    doc.add_heading(line, level=max(1, heading_level))
-                else:
-                    # Regular paragraph - collect consecutive lines
-                    paragraph_lines = [line]
-                    j = i + 1
-
-                    # Collect lines until next heading or empty line
-                    while j < len(lines):
-                        next_line = lines[j].strip()
-                        if not next_line:  # Empty line ends paragraph
-                            break
-
-                        # Check if next line is a heading
-                        is_next_heading = any(heading_idx == j for heading_idx, _, _ in headings)
-                        if is_next_heading:
-                            break
-
-                        paragraph_lines.append(next_line)
-                        j += 1
-
-                    # Create paragraph with proper spacing
-                    if paragraph_lines:
-                        paragraph_text = ' '.join(paragraph_lines)
-                        paragraph = doc.add_paragraph()
-                        paragraph.add_run(paragraph_text)
-
-                    i = j - 1  # Adjust index for collected lines
+            parts, body_prefix, body_suffix = _get_docx_template()
+
+            # The package is written directly: the empty document's parts are
+            # copied and the body is streamed into word/document.xml, so
+            # no python-docx element tree is built for the content
+            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as package:
+                for name, data in parts:
+                    if data is not None:
+                        package.writestr(name, data)
+                        continue
+                    with package.open(name, 'w') as document_xml:
+                        document_xml.write(body_prefix)
+                        for paragraph_xml in self._iter_body_xml(processed_text):
+                            document_xml.write(paragraph_xml.encode('utf-8'))
+                        document_xml.write(body_suffix)
 
-                i += 1
-
-            # Save the document
-            doc.save(output_path)
             logger.info(f"Word document saved with enhanced formatting: {output_path}")
 
         except Exception as e:
@@ -502,7 +953,8 @@ Return ONLY the corrected text with proper spacing:"""
             raise
     
     def convert_pdf_to_word(self, pdf_path: str, output_path: Optional[str] = None,
-                           generate_report: bool = False) -> str:
+                           generate_report: bool = False,
+                           progress_callback: Optional[Callable[[int, int], None]] = None) -> str:
         """
         Enhanced main conversion method with analytics and quality checking
 
@@ -510,6 +962,8 @@ Return ONLY the corrected text with proper spacing:"""
             pdf_path (str): Path to input PDF file
             output_path (str, optional): Path for output Word file
             generate_report (bool): Generate detailed conversion report
+            progress_callback (callable, optional): Called with (chunks done,
+                total chunks) as Gemini finishes each chunk of the document
 
         Returns:
             str: Path to the created Word document
@@ -517,6 +971,10 @@ Return ONLY the corrected text with proper spacing:"""
         start_time = time.time()
         success = False
         pages_processed = 0
+        extraction_method = None
+        # Cleared so a conversion that fails before extraction doesn't report
+        # the previous file's method (batch workers reuse one converter)
+        self.extraction_method_used = None
 
         try:
             # Validate input file
@@ -530,19 +988,46 @@ Return ONLY the corrected text with proper spacing:"""
 
             logger.info(f"Starting enhanced conversion: {pdf_path} -> {output_path}")
 
-            # Step 1: Extract text from PDF
-            logger.info("Extracting text from PDF...")
-            raw_text = self.extract_text_from_pdf(pdf_path)
-
-            if not raw_text.strip():
-                raise ValueError("No text content found in PDF")
-
-            # Estimate pages processed (rough estimate based on text length)
-            pages_processed = max(1, len(raw_text) // 2000)  # ~2000 chars per page
-
-            # Step 2: Process with Gemini API
-            logger.info("Processing text with Gemini API...")
-            ai_processed_text = self.process_with_gemini(raw_text)
+            # An unchanged PDF processed by the same model reuses the stored
+            # Gemini output and skips extraction and the API entirely; with
+            # another model it still reuses the stored extracted pages
+            document_key = None
+            pages_key = None
+            ai_processed_text = None
+            if self.cache:
+                file_hash = self.cache.hash_file(pdf_path)
+                document_key = self.cache.make_file_key(file_hash, self.current_model_name, _PROMPT_VERSION,
+                                                       _EXTRACTION_VERSION)
+                pages_key = self.cache.make_pages_key(file_hash, _EXTRACTION_VERSION)
+                ai_processed_text = self.cache.get(document_key)
+
+            if ai_processed_text is not None:
+                logger.info("Reusing cached Gemini output for unchanged PDF")
+                self.extraction_method_used = extraction_method = "cache"
+                pages_processed = max(1, len(ai_processed_text) // 2000)
+            else:
+                # Step 1: Extract text from PDF
+                pages = self.cache.get_pages(pages_key) if pages_key else None
+                if pages is not None:
+                    logger.info("Reusing cached extracted text for unchanged PDF")
+                    self.extraction_method_used = extraction_method = "cache"
+                else:
+                    logger.info("Extracting text from PDF...")
+                    with self._extraction_lock:
+                        pages, extraction_method = self._extract_pages(pdf_path)
+                    self.extraction_method_used = extraction_method
+                    if pages_key:
+                        self.cache.set_pages(pages_key, pages)
+
+                # Estimate pages processed (rough estimate based on text length)
+                text_length = sum(len(page) + 2 for page in pages)
+                pages_processed = max(1, text_length // 2000)  # ~2000 chars per page
+
+                # Step 2: Process with Gemini API
+                logger.info("Processing text with Gemini API...")
+                ai_processed_text, reusable = self._process_with_gemini(pages, progress_callback)
+                if document_key and reusable:
+                    self.cache.set(document_key, ai_processed_text)
 
             # Step 3: Post-process for final spacing validation
             logger.info("Applying final spacing validation...")
@@ -590,6 +1075,8 @@ Return ONLY the corrected text with proper spacing:"""
             raise
 
         finally:
+            self.pages_processed = pages_processed
+
             # Record statistics
             if self.stats:
                 processing_time = time.time() - start_time
@@ -598,23 +1085,171 @@ Return ONLY the corrected text with proper spacing:"""
                     pages=pages_processed,
                     processing_time=processing_time,
                     model_used=self.current_model_name,
-                    extraction_method=self.extraction_method_used
+                    extraction_method=extraction_method
+                )
+
+    async def convert_many(self, pdf_paths: List[str], output_dir: Optional[str] = None,
+                           concurrency: int = 4, generate_report: bool = False
+                           ) -> List[Tuple[str, Optional[str], Optional[Exception]]]:
+        """
+        Convert several PDFs concurrently with this converter
+
+        Conversions run in threads, so their Gemini requests overlap while
+        the models and caches are shared; extraction runs one file at a time.
+        convert_batch suits large CPU-bound batches better, since it spreads
+        files over processes.
+
+        Args:
+            pdf_paths (List[str]): PDF files to convert
+            output_dir (str, optional): Directory for the Word files (defaults
+                to the convert_pdf_to_word default for each file)
+            concurrency (int): Maximum conversions running at once
+            generate_report (bool): Generate a conversion report for each file
+
+        Returns:
+            List[Tuple[str, Optional[str], Optional[Exception]]]: One
+            (pdf_path, output_path, error) entry per file in input order;
+            output_path is None and error is set when a conversion failed
+        """
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def convert(pdf_path: str) -> Tuple[str, Optional[str], Optional[Exception]]:
+            output_path = None
+            if output_dir:
+                output_path = os.path.join(output_dir, f"{Path(pdf_path).stem}_converted.docx")
+            async with semaphore:
+                try:
+                    result = await loop.run_in_executor(
+                        None, self.convert_pdf_to_word, pdf_path, output_path, generate_report
+                    )
+                except Exception as e:
+                    return pdf_path, None, e
+            return pdf_path, result, None
+
+        return await asyncio.gather(*(convert(pdf_path) for pdf_path in pdf_paths))
+
+# Converter owned by a batch worker process, created once by _init_batch_worker
+_batch_converter = None
+
+
+def _init_batch_worker(api_key: str, converter_options: dict, gemini_slots) -> None:
+    """Create the converter reused for every file handled by this worker process"""
+    global _batch_converter
+    _batch_converter = PDFToWordConverter(api_key, **converter_options)
+    _batch_converter._gemini_slots = gemini_slots
+
+
+def _convert_one(pdf_path: str, output_path: str, generate_report: bool) -> dict:
+    """
+    Convert one PDF in a batch worker process
+
+    Statistics are not recorded here: the parent process records every
+    outcome, so workers never write the statistics file concurrently.
+    """
+    converter = _batch_converter
+    start_time = time.time()
+    error = None
+    try:
+        converter.convert_pdf_to_word(pdf_path, output_path, generate_report=generate_report)
+    except Exception as e:
+        error = str(e)
+    return {
+        "pdf_path": pdf_path,
+        "output_path": output_path,
+        "success": error is None,
+        "error": error,
+        "processing_time": time.time() - start_time,
+        "pages": converter.pages_processed,
+        "model_used": converter.current_model_name,
+        "extraction_method": converter.extraction_method_used,
+    }
+
+
+def convert_batch(pdf_dir: str, api_key: str, output_dir: Optional[str] = None, workers: Optional[int] = None,
+                  generate_report: bool = False, enable_stats: bool = True, **converter_options) -> List[dict]:
+    """
+    Convert every PDF in a directory, one file per worker process
+
+    Args:
+        pdf_dir (str): Directory containing the PDF files
+        api_key (str): Google Gemini API key
+        output_dir (str, optional): Directory for the Word files (defaults to pdf_dir)
+        workers (int, optional): Number of files converted in parallel (defaults to CPU count)
+        generate_report (bool): Generate a conversion report for each file
+        enable_stats (bool): Record every outcome in the conversion statistics
+        **converter_options: Further PDFToWordConverter arguments, e.g. preferred_model
+
+    Returns:
+        List[dict]: One result per file, in completion order
+    """
+    pdf_files = sorted(p for p in Path(pdf_dir).iterdir() if p.suffix.lower() == '.pdf')
+    if not pdf_files:
+        raise FileNotFoundError(f"No PDF files found in: {pdf_dir}")
+
+    output_path = Path(output_dir or pdf_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    stats = ConversionStats() if ConversionStats and enable_stats else None
+
+    # Files are the unit of parallelism, so each worker extracts its pages serially
+    converter_options = dict(converter_options, enable_stats=False, workers=1)
+    workers = min(workers or os.cpu_count() or 1, len(pdf_files))
+    logger.info(f"Converting {len(pdf_files)} PDF files with {workers} worker processes")
+    # One limit for the whole batch, not one per worker process
+    gemini_slots = multiprocessing.BoundedSemaphore(
+        max(1, converter_options.get('gemini_concurrency') or _GEMINI_MAX_WORKERS)
+    )
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(api_key, converter_options, gemini_slots)) as executor:
+        futures = [
+            executor.submit(_convert_one, str(pdf_file), str(output_path / f"{pdf_file.stem}_converted.docx"),
+                            generate_report)
+            for pdf_file in pdf_files
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            if stats:
+                stats.record_conversion(
+                    success=result["success"],
+                    pages=result["pages"],
+                    processing_time=result["processing_time"],
+                    model_used=result["model_used"],
+                    extraction_method=result["extraction_method"]
                 )
+            results.append(result)
+    return results
+
 
 def main():
     """Enhanced main function with advanced features"""
     parser = argparse.ArgumentParser(description='Convert PDF to Word using Gemini API with advanced features')
-    parser.add_argument('pdf_file', help='Path to the PDF file to convert')
-    parser.add_argument('-o', '--output', help='Output Word file path (optional)')
+    parser.add_argument('pdf_file', nargs='?', help='Path to the PDF file to convert')
+    parser.add_argument('-o', '--output', help='Output Word file path, or output directory with --batch-dir (optional)')
+    parser.add_argument('--batch-dir', help='Convert every PDF in this directory in parallel')
     parser.add_argument('-k', '--api-key', help='Gemini API key (or set GEMINI_API_KEY env var)')
     parser.add_argument('-m', '--model', help='Preferred Gemini model to use')
     parser.add_argument('-r', '--report', action='store_true', help='Generate detailed conversion report')
     parser.add_argument('--list-models', action='store_true', help='List available Gemini models')
     parser.add_argument('--stats', action='store_true', help='Show conversion statistics')
     parser.add_argument('--no-stats', action='store_true', help='Disable statistics tracking')
+    parser.add_argument('--no-cache', action='store_true', help='Disable reuse of cached Gemini output')
+    parser.add_argument('--workers', type=int,
+                        help=f'Number of processes for page extraction (default: CPU count, at most '
+                             f'{_DEFAULT_MAX_EXTRACTION_WORKERS}), or for files with --batch-dir (default: CPU count)')
+    parser.add_argument('--gemini-concurrency', type=int,
+                        help=f'Maximum Gemini requests in flight at once, shared by all files '
+                             f'with --batch-dir (default: {_GEMINI_MAX_WORKERS})')
 
     args = parser.parse_args()
 
+    if not (args.pdf_file or args.batch_dir or args.list_models or args.stats):
+        parser.error("a PDF file or --batch-dir is required")
+
     # Get API key from argument or environment variable
     api_key = args.api_key or os.getenv('GEMINI_API_KEY')
 
@@ -622,10 +1257,40 @@ def main():
         logger.error("Gemini API key is required. Provide it via --api-key argument or GEMINI_API_KEY environment variable")
         sys.exit(1)
 
+    if args.batch_dir:
+        try:
+            start_time = time.time()
+            results = convert_batch(args.batch_dir, api_key, output_dir=args.output, workers=args.workers,
+                                    generate_report=args.report, enable_stats=not args.no_stats,
+                                    preferred_model=args.model, enable_cache=not args.no_cache,
+                                    gemini_concurrency=args.gemini_concurrency)
+        except Exception as e:
+            logger.error(f"Batch conversion failed: {str(e)}")
+            sys.exit(1)
+
+        elapsed = time.time() - start_time
+        succeeded = [r for r in results if r["success"]]
+        for result in results:
+            if result["success"]:
+                print(f"✅ {result['pdf_path']} -> {result['output_path']}")
+            else:
+                print(f"❌ {result['pdf_path']}: {result['error']}")
+
+        print(f"\n📊 Batch summary:")
+        print(f"• Total files: {len(results)}")
+        print(f"• Successful: {len(succeeded)}")
+        print(f"• Failed: {len(results) - len(succeeded)}")
+        print(f"• Elapsed: {elapsed:.1f}s ({len(results) / max(elapsed, 0.001) * 60:.1f} files/min)")
+        if len(succeeded) < len(results):
+            sys.exit(1)
+        return
+
     try:
         # Initialize converter
         enable_stats = not args.no_stats
-        converter = PDFToWordConverter(api_key, preferred_model=args.model, enable_stats=enable_stats)
+        converter = PDFToWordConverter(api_key, preferred_model=args.model, enable_stats=enable_stats,
+                                       enable_cache=not args.no_cache, workers=args.workers,
+                                       gemini_concurrency=args.gemini_concurrency)
 
         # Handle list models command
         if args.list_models:
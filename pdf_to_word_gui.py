@@ -6,17 +6,24 @@ Simple graphical interface for converting PDF files to Word documents using Gemi
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import os
+import subprocess
 from pathlib import Path
 import sys
 
-# Import our converter class
-try:
-    from pdf_to_word_converter import PDFToWordConverter
-except ImportError:
-    messagebox.showerror("Error", "pdf_to_word_converter.py not found in the same directory!")
-    sys.exit(1)
+# Queued log messages are written to the log area every _LOG_POLL_MS
+# milliseconds, at most _LOG_BATCH_MAX per insert
+_LOG_POLL_MS = 50
+_LOG_BATCH_MAX = 200
+
+# Older lines are dropped once the log area holds this many
+_LOG_MAX_LINES = 5000
+
+# Command that opens a file in its default application (Windows uses
+# os.startfile instead)
+_FILE_OPENER = ['open'] if sys.platform == 'darwin' else ['xdg-open']
 
 class PDFToWordGUI:
     def __init__(self, root):
@@ -34,11 +41,23 @@ class PDFToWordGUI:
         self.is_converting = False
         self.available_models = []
 
+        # log_message may be called from the conversion thread, and Tk widgets
+        # may only be touched from the main thread, so messages go through a
+        # queue that the main loop drains
+        self._log_queue = queue.Queue()
+
+        # Conversions run on one long-lived worker thread; only one runs at a
+        # time (see is_converting)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='convert')
+        self._closing = False
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # Load API key from environment if available
         env_api_key = os.getenv('GEMINI_API_KEY', '')
         self.api_key.set(env_api_key)
         
         self.setup_ui()
+        self.root.after(_LOG_POLL_MS, self._drain_log)
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -112,7 +131,7 @@ class PDFToWordGUI:
         # Log area
         ttk.Label(main_frame, text="Conversion Log:").grid(row=9, column=0, sticky=tk.W, pady=(20, 5))
 
-        self.log_text = scrolledtext.ScrolledText(main_frame, height=12, width=70)
+        self.log_text = scrolledtext.ScrolledText(main_frame, height=12, width=70, state="disabled")
         self.log_text.grid(row=10, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
 
         # Configure grid weights for resizing
@@ -130,6 +149,7 @@ class PDFToWordGUI:
         try:
             if self.api_key.get().strip():
                 self.log_message("🔄 Fetching available models...")
+                from pdf_to_word_converter import PDFToWordConverter
                 converter = PDFToWordConverter(self.api_key.get().strip())
                 self.available_models = converter.get_available_models()
 
@@ -173,9 +193,8 @@ class PDFToWordGUI:
         if file_path:
             self.pdf_file_path.set(file_path)
             # Auto-generate output filename
-            pdf_name = Path(file_path).stem
-            output_path = str(Path(file_path).parent / f"{pdf_name}_converted.docx")
-            self.output_file_path.set(output_path)
+            pdf = Path(file_path)
+            self.output_file_path.set(str(pdf.with_name(f"{pdf.stem}_converted.docx")))
             self.log_message(f"Selected PDF: {file_path}")
     
     def browse_output_file(self):
@@ -203,33 +222,47 @@ You can also set the GEMINI_API_KEY environment variable to avoid entering it ea
         messagebox.showinfo("API Key Help", help_text)
     
     def log_message(self, message):
-        """Add message to log area"""
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """Add message to log area (safe to call from any thread)"""
+        self._log_queue.put(message)
+    
+    def _drain_log(self):
+        """Write the queued log messages to the log area in a single insert"""
+        messages = []
+        try:
+            while len(messages) < _LOG_BATCH_MAX:
+                messages.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if messages:
+            # The log area is read-only; it is only writable for this insert
+            self.log_text.configure(state="normal")
+            self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+            self.log_text.delete("1.0", f"end-{_LOG_MAX_LINES}l")
+            self.log_text.configure(state="disabled")
+            self.log_text.see(tk.END)
+        self.root.after(_LOG_POLL_MS, self._drain_log)
     
     def update_status(self, message, color="black"):
         """Update status label"""
         self.status_label.config(text=message, foreground=color)
-        self.root.update_idletasks()
     
     def validate_inputs(self):
         """Validate user inputs before conversion"""
-        if not self.api_key.get().strip():
-            messagebox.showerror("Error", "Please enter your Gemini API key")
-            return False
-        
-        if not self.pdf_file_path.get().strip():
-            messagebox.showerror("Error", "Please select a PDF file")
-            return False
-        
-        if not os.path.exists(self.pdf_file_path.get()):
-            messagebox.showerror("Error", "Selected PDF file does not exist")
-            return False
+        api_key = self.api_key.get().strip()
+        pdf_path = self.pdf_file_path.get().strip()
+        output_path = self.output_file_path.get().strip()
         
-        if not self.output_file_path.get().strip():
-            messagebox.showerror("Error", "Please specify an output file location")
-            return False
+        checks = [
+            (api_key, "Please enter your Gemini API key"),
+            (pdf_path, "Please select a PDF file"),
+            (pdf_path and Path(pdf_path).is_file(), "Selected PDF file does not exist"),
+            (output_path, "Please specify an output file location"),
+        ]
+        for ok, message in checks:
+            if not ok:
+                messagebox.showerror("Error", message)
+                return False
         
         return True
     
@@ -246,37 +279,51 @@ You can also set the GEMINI_API_KEY environment variable to avoid entering it ea
         self.progress.start()
         self.update_status("Converting...", "blue")
         
-        # Start conversion in separate thread to prevent GUI freezing
-        thread = threading.Thread(target=self.perform_conversion)
-        thread.daemon = True
-        thread.start()
+        # Run the conversion on the worker thread to prevent GUI freezing; the
+        # inputs are read here, since Tk variables belong to the main thread
+        future = self._executor.submit(
+            self.perform_conversion,
+            self.api_key.get().strip(),
+            self.pdf_file_path.get().strip(),
+            self.output_file_path.get().strip(),
+            self.selected_model.get() or None,
+            self.generate_report.get()
+        )
+        future.add_done_callback(self._on_conversion_done)
+    
+    def perform_conversion(self, api_key, pdf_path, output_path, selected_model, generate_report):
+        """Perform the actual conversion (runs on the worker thread)"""
+        self.log_message("Starting conversion process...")
+
+        # Imported here rather than at module level so the window opens without
+        # waiting for the Gemini SDK and PDF libraries; an ImportError reaches
+        # conversion_error like any other failure
+        from pdf_to_word_converter import PDFToWordConverter
+
+        # Initialize converter with selected model
+        converter = PDFToWordConverter(api_key, preferred_model=selected_model)
+        self.log_message("✅ Gemini API initialized successfully")
+        self.log_message(f"🤖 Using AI model: {converter.get_current_model()}")
+        self.log_message(f"📋 Available models: {len(converter.get_available_models())}")
+        self.log_message("📄 Starting multi-method PDF extraction with spacing optimization...")
+        
+        # Perform conversion
+        return converter.convert_pdf_to_word(
+            pdf_path=pdf_path,
+            output_path=output_path,
+            generate_report=generate_report,
+            progress_callback=lambda done, total: self.log_message(
+                f"🤖 Gemini processed chunk {done}/{total}")
+        )
     
-    def perform_conversion(self):
-        """Perform the actual conversion"""
+    def finish_conversion(self, future):
+        """Report the outcome of a finished conversion (runs on the main thread)"""
         try:
-            self.log_message("Starting conversion process...")
-
-            # Initialize converter with selected model
-            selected_model = self.selected_model.get() if self.selected_model.get() else None
-            converter = PDFToWordConverter(self.api_key.get().strip(), preferred_model=selected_model)
-            self.log_message("✅ Gemini API initialized successfully")
-            self.log_message(f"🤖 Using AI model: {converter.get_current_model()}")
-            self.log_message(f"📋 Available models: {len(converter.get_available_models())}")
-            self.log_message("📄 Starting multi-method PDF extraction with spacing optimization...")
-            
-            # Perform conversion
-            output_file = converter.convert_pdf_to_word(
-                pdf_path=self.pdf_file_path.get(),
-                output_path=self.output_file_path.get(),
-                generate_report=self.generate_report.get()
-            )
-            
-            # Success
-            self.root.after(0, self.conversion_success, output_file)
-            
+            output_file = future.result()
         except Exception as e:
-            # Error
-            self.root.after(0, self.conversion_error, str(e))
+            self.conversion_error(str(e))
+        else:
+            self.conversion_success(output_file)
     
     def conversion_success(self, output_file):
         """Handle successful conversion"""
@@ -291,12 +338,39 @@ You can also set the GEMINI_API_KEY environment variable to avoid entering it ea
         # Ask if user wants to open the file
         if messagebox.askyesno("Success", f"Conversion completed!\n\nOpen the Word document now?"):
             try:
-                os.startfile(output_file)  # Windows
-            except AttributeError:
-                try:
-                    os.system(f'open "{output_file}"')  # macOS
-                except:
-                    os.system(f'xdg-open "{output_file}"')  # Linux
+                if sys.platform == 'win32':
+                    os.startfile(output_file)
+                else:
+                    # No shell is involved, so the path needs no quoting
+                    subprocess.Popen(_FILE_OPENER + [output_file], start_new_session=True)
+            except OSError as e:
+                self.log_message(f"⚠️ Could not open the Word document: {e}")
+    
+    def _on_conversion_done(self, future):
+        """Hand a finished conversion back to the main thread (runs on the worker thread)"""
+        if self._closing:
+            return
+        try:
+            self.root.after(0, self.finish_conversion, future)
+        except tk.TclError:
+            # The window was destroyed after the _closing check
+            pass
+    
+    def on_close(self):
+        """
+        Close the window and drop any queued conversion
+        
+        A conversion that is already running can't be interrupted; it
+        finishes in the background before the process exits, and its
+        result is discarded.
+        """
+        self._closing = True
+        try:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            # cancel_futures needs Python 3.9
+            self._executor.shutdown(wait=False)
+        self.root.destroy()
     
     def conversion_error(self, error_message):
         """Handle conversion error"""